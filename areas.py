@@ -1,3 +1,5 @@
+import functools
+
 from utils import get_file_path
 
 import geopandas as gpd
@@ -38,3 +40,13 @@ def map_grid_cells_to_areas(
     )
 
     return gdf_affected_adm_areas.drop_duplicates(subset=[f"GID_{level}"])
+
+
+@functools.lru_cache(maxsize=1)
+def get_bandung_regency() -> gpd.GeoDataFrame:
+    """Returns the GeoDataFrame row (gadm level 2) of the Bandung Regency.
+
+    The Indonesia-wide shapefile is only read and filtered once per process.
+    """
+    gdf = gpd.read_file(get_file_path("cadastre/gadm41_IDN_2.shp"))
+    return gdf[(gdf["NAME_2"] == "Bandung") & (gdf["TYPE_2"] == "Kabupaten")]
@@ -236,6 +236,8 @@ def alert_on_flood_threat(flood_hazard_index, whatsapp_group_id=None, whatsapp_p
                 
                 if whatsapp_alert_status["status"] == "success":
                     logger.info("WhatsApp alert sent successfully")
+                elif whatsapp_alert_status["status"] == "queued":
+                    logger.info(f"WhatsApp alert queued: {whatsapp_alert_status['message']}")
                 else:
                     logger.error(f"Failed to send WhatsApp alert: {whatsapp_alert_status['message']}")
             
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+import math
 
 import geopandas as gpd
 from shapely.geometry import Polygon
@@ -21,8 +24,11 @@ HazardIndexIdentifier = str
 
 Angle = float
 
+# Shared by all sources, fetching is mostly waiting on the network.
+FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="fetch")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Extent:
     lon_min: Angle
     lon_max: Angle
@@ -54,11 +60,11 @@ class Extent:
 
     def grow_extent(self, resolution: float) -> "Extent":
         (lon_min, lon_max, lat_min, lat_max) = self.as_tuple
-        lat_min = np.floor(lat_min / resolution) * resolution
-        lat_max = np.ceil(lat_max / resolution) * resolution
+        lat_min = math.floor(lat_min / resolution) * resolution
+        lat_max = math.ceil(lat_max / resolution) * resolution
 
-        lon_min = np.floor(lon_min / resolution) * resolution
-        lon_max = np.ceil(lon_max / resolution) * resolution
+        lon_min = math.floor(lon_min / resolution) * resolution
+        lon_max = math.ceil(lon_max / resolution) * resolution
 
         return Extent(lon_min, lon_max, lat_min, lat_max)
 
@@ -70,15 +76,7 @@ class Extent:
         return int((self.lat_max - self.lat_min) // angular_resolution + 1)
 
     def reproject(self, src_crs, dst_crs) -> "Extent":
-        dst_lon_min, dst_lat_min = dst_crs.transform_point(
-            self.lon_min, self.lat_min, src_crs
-        )
-
-        dst_lon_max, dst_lat_max = dst_crs.transform_point(
-            self.lon_max, self.lat_max, src_crs
-        )
-
-        return Extent(dst_lon_min, dst_lon_max, dst_lat_min, dst_lat_max)
+        return Extent(*_reproject_extent(self.as_tuple, src_crs, dst_crs))
 
     def pixel_size(self, resolution: Resolution):
         """Calculates the size of each pixel given a certain image resolution for this extent
@@ -91,6 +89,21 @@ class Extent:
         return (psize_lon, psize_lat)
 
 
+@functools.lru_cache(maxsize=32)
+def _reproject_extent(
+    extent: typing.Tuple[Angle, Angle, Angle, Angle], src_crs, dst_crs
+) -> typing.Tuple[float, float, float, float]:
+    """Reprojects the corners of an extent, see `Extent.reproject`.
+
+    Cached, as the same extents are reprojected for every source.
+    """
+    lon_min, lon_max, lat_min, lat_max = extent
+    dst_lon_min, dst_lat_min = dst_crs.transform_point(lon_min, lat_min, src_crs)
+    dst_lon_max, dst_lat_max = dst_crs.transform_point(lon_max, lat_max, src_crs)
+
+    return (dst_lon_min, dst_lon_max, dst_lat_min, dst_lat_max)
+
+
 @dataclass
 class RasterizedInformation:
     """A rasterized data object storing geographical data with its metadata.
@@ -103,6 +116,11 @@ class RasterizedInformation:
     extent: Extent
     raster: np.ndarray
 
+    # Memoized results of `to_gdf`, keyed on the CRS.
+    _gdf_cache: typing.Dict[str, gpd.GeoDataFrame] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def __mul__(self, other):
         # TODO: We could return a subset if the maps overlap but have a different extent
         if isinstance(other, type(self)):
@@ -142,7 +160,13 @@ class RasterizedInformation:
 
         Raster array values are stored in the "value" column.
         The polygons are stored in the "geometry" column.
+
+        The result is cached per CRS, as several notifiers convert the same
+        raster. Callers must not modify the returned GeoDataFrame in place.
         """
+        if crs in self._gdf_cache:
+            return self._gdf_cache[crs]
+
         yn, xn = self.raster.shape
         pixel_width, pixel_height = self.extent.pixel_size(Resolution(lat=yn, lon=xn))
         assert pixel_width > 0
@@ -163,6 +187,7 @@ class RasterizedInformation:
 
         # TODO: Extract column names to constants.
         gdf = gpd.GeoDataFrame({"value": values, "geometry": polygons}, crs=crs)
+        self._gdf_cache[crs] = gdf
         return gdf
 
 
@@ -185,6 +210,12 @@ class Source(Identifiable):
     ) -> RasterizedInformation:
         pass
 
+    def fetch_data_async(
+        self, extent: Extent, resolution: Resolution
+    ) -> "Future[RasterizedInformation]":
+        """Runs `fetch_data` on the shared fetch executor."""
+        return FETCH_EXECUTOR.submit(self.fetch_data, extent, resolution)
+
     @property
     @abstractmethod
     def max_resolution(self) -> Resolution:
@@ -261,7 +292,7 @@ class Registry:
     def run(self, extent: Extent, resolution: Resolution):
         # TODO: Refactor to generic job queue, where we don't distinguish
         # between sources, indices and notifiers.
-        # TODO: Parallelize the fetching of data and computation of indices.
+        # TODO: Parallelize the computation of indices.
 
         logger.info("Determining dependencies")
         indices = set(
@@ -283,10 +314,14 @@ class Registry:
         logger.debug(f"Sources in use: {sources}")
 
         logger.info("Fetching data")
-        source_res = {
-            source_id: self._sources[source_id].fetch_data(extent, resolution)
+        # Sources are fetched concurrently, the total time is that of the slowest.
+        source_futures = {
+            source_id: self._sources[source_id].fetch_data_async(extent, resolution)
             for source_id in sources
         }
+        source_res = {
+            source_id: future.result() for source_id, future in source_futures.items()
+        }
 
         logger.info("Calculating indices")
         index_res = {
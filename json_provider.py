@@ -0,0 +1,38 @@
+"""Faster JSON (de)serialization for the Flask messaging APIs.
+
+orjson is optional, without it Flask's default provider is kept.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Types orjson does not handle natively fall back to Flask's `default`.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(
+            obj, default=kwargs.get("default", self.default), option=option
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def use_fast_json(app):
+    """Serializes the app's JSON with orjson, if it is installed."""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
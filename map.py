@@ -1,32 +1,14 @@
 #!/usr/env/python
-from datetime import timedelta
-import os
-
 import cartopy.feature as cfeature
-import geopandas as gpd
 
 import cartopy.crs as ccrs
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
-from pyproj import Transformer
 from interface import Extent
 
-import requests_cache
 import numpy as np
 
 from sources import *
-
-SESSION = requests_cache.CachedSession(
-    "demo_cache",
-    use_cache_dir=True,  # Save files in the default user cache dir
-    cache_control=False,  # Use Cache-Control response headers for expiration, if available
-    expire_after=timedelta(days=7),  # Otherwise expire responses after one day
-    allowable_codes=[
-        200,
-    ],
-    allowable_methods=["GET", "POST"],  # Cache whatever HTTP methods you want
-    stale_if_error=True,  # In case of request errors, use stale cache data if possible
-)
+from areas import get_bandung_regency
 
 RESOLUTION = 2**10
 PLATE_CARREE_EPSG = 32662
@@ -60,13 +42,7 @@ def main():
     ax.set_title("Data (using data_for_domain)")
     ax.add_feature(cfeature.COASTLINE)
 
-    # FIXME: write this geometry to somewhere or make this file available somehow
-    gdf = gpd.read_file(
-        os.path.join(
-            os.path.dirname(os.path.realpath(__file__)), "cadastre/gadm41_IDN_2.shp"
-        )
-    )
-    bandung = gdf[(gdf["NAME_2"] == "Bandung") & (gdf["TYPE_2"] == "Kabupaten")]
+    bandung = get_bandung_regency()
     bandung.geometry.boundary.plot(ax=ax)
 
     # NOTE: -- PRECIPITATION (prediction)
@@ -127,6 +103,11 @@ def main():
 
 
 def plot_map(lat, lon):
+    # Imported lazily, Basemap and pyproj are expensive to load and this
+    # function is not used by `main`.
+    from mpl_toolkits.basemap import Basemap
+    from pyproj import Transformer
+
     lat_0 = (lat[1] + lat[0]) / 2
     lon_0 = (lon[1] + lon[0]) / 2
 
@@ -188,10 +169,9 @@ def plot_map_cartopy(lat, lon):
     # ax.add_feature(cfeature.LAKES, alpha=0.5)
     # ax.add_feature(cfeature.RIVERS)
 
-    gdf = gpd.read_file("cadastre/gadm41_IDN_2.shp")
-    bandung = gdf[(gdf["NAME_2"] == "Bandung") & (gdf["TYPE_2"] == "Kabupaten")]
+    bandung = get_bandung_regency()
 
-    # ax.add_geometries(bandung.geometry, crs=gdf.crs)
+    # ax.add_geometries(bandung.geometry, crs=bandung.crs)
 
     bandung.geometry.boundary.plot(ax=ax)
 
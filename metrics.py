@@ -1,4 +1,36 @@
 from dataclasses import dataclass
+import functools
+import typing
+
+_FORMAT = (
+    "Metrics:\n"
+    "          TP: {tp:5d} FP: {fp:5d}\n"
+    "          FN: {fn:5d} TN: {tn:5d}\n"
+    "          Accuracy: {accuracy:.3f}\n"
+    "          Precision: {precision:.3f}\n"
+    "          Recall: {recall:.3f}\n"
+    "          F1 Score: {f1_score:.3f}"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _derive(
+    tp: int, fp: int, tn: int, fn: int
+) -> typing.Tuple[float, float, float, float]:
+    """Returns (accuracy, precision, recall, f1_score) for a confusion matrix."""
+    total = tp + tn + fp + fn
+    accuracy = (tp + tn) / total if total > 0 else 0
+
+    precision_denom = tp + fp
+    precision = tp / precision_denom if precision_denom > 0 else 0
+
+    recall_denom = tp + fn
+    recall = tp / recall_denom if recall_denom > 0 else 0
+
+    f1_denom = precision + recall
+    f1_score = 2 * (precision * recall) / f1_denom if f1_denom > 0 else 0
+
+    return accuracy, precision, recall, f1_score
 
 
 @dataclass
@@ -9,24 +41,19 @@ class Metrics:
     fn: int = 0
 
     def __str__(self):
-        total = self.tp + self.tn + self.fp + self.fn
-        accuracy = (self.tp + self.tn) / total if total > 0 else 0
-
-        precision_denom = self.tp + self.fp
-        precision = self.tp / precision_denom if precision_denom > 0 else 0
-
-        recall_denom = self.tp + self.fn
-        recall = self.tp / recall_denom if recall_denom > 0 else 0
-
-        f1_denom = precision + recall
-        f1_score = 2 * (precision * recall) / f1_denom if f1_denom > 0 else 0
-
-        return (
-            f"Metrics:\n"
-            f"          TP: {self.tp:5d} FP: {self.fp:5d}\n"
-            f"          FN: {self.fn:5d} TN: {self.tn:5d}\n"
-            f"          Accuracy: {accuracy:.3f}\n"
-            f"          Precision: {precision:.3f}\n"
-            f"          Recall: {recall:.3f}\n"
-            f"          F1 Score: {f1_score:.3f}"
+        # The counters are mutated while backtesting, so the derived numbers
+        # are cached on their values rather than on this object.
+        accuracy, precision, recall, f1_score = _derive(
+            self.tp, self.fp, self.tn, self.fn
+        )
+
+        return _FORMAT.format(
+            tp=self.tp,
+            fp=self.fp,
+            tn=self.tn,
+            fn=self.fn,
+            accuracy=accuracy,
+            precision=precision,
+            recall=recall,
+            f1_score=f1_score,
         )
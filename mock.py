@@ -10,6 +10,8 @@ import pathlib
 import importlib.util
 from datetime import datetime, timedelta
 
+import numpy as np
+
 # dynamically loading backtest-v2.py as its not recognizing it as a module
 spec = importlib.util.spec_from_file_location(
     "backtest_v2",
@@ -32,8 +34,7 @@ GADMLocationManager   = backtest_v2.GADMLocationManager
 
 
 def _fake_compute_prediction(run_dt, extent, resolution, params):
-    key = run_dt.date()
-    hits = POS_BY_DATE.get(key, set())
+    hits = POS_BY_ORD.get(run_dt.toordinal(), set())
 
     # apply a “threshold”: only keep a hit if we have at least that many on this date
     # (just an example of how you might use th)
@@ -68,25 +69,33 @@ GIDS = [
 ]
 
 # --------------- Grid search function ---------------
+def _membership_matrix(dates, gids, gids_on_date):
+    """Boolean matrix of shape (dates, gids), True where `gids_on_date(dt)` contains the gid."""
+    gid_index = {gid: i for i, gid in enumerate(gids)}
+    matrix = np.zeros((len(dates), len(gids)), dtype=bool)
+    for d, dt in enumerate(dates):
+        for gid in gids_on_date(dt):
+            if gid in gid_index:
+                matrix[d, gid_index[gid]] = True
+    return matrix
+
+
 def run_grid_search(store, dates, gids, extent, res, thresholds, weights):
+    # The actual events do not depend on the parameters, so only build them once.
+    actual = _membership_matrix(dates, gids, store.get_events_on_date_gid2s)
+
     results = []
     for th in thresholds:
         for w in weights:
-            tp=fp=fn=tn=0
-            for dt in dates:
-                predicted = compute_prediction(
-                    dt, extent, res,
-                    {"hazard_index_threshold": th,
-                     "mix_weight":             w}
-                )
-                actual = store.get_events_on_date_gid2s(dt)
-                for gid in gids:
-                    hit  = gid in predicted
-                    real = gid in actual
-                    if   real and   hit: tp+=1
-                    elif real and not hit: fn+=1
-                    elif not real and hit: fp+=1
-                    else:                  tn+=1
+            params = {"hazard_index_threshold": th,
+                      "mix_weight":             w}
+            predicted = _membership_matrix(
+                dates, gids, lambda dt: compute_prediction(dt, extent, res, params)
+            )
+            tp = int(np.count_nonzero(actual & predicted))
+            fn = int(np.count_nonzero(actual & ~predicted))
+            fp = int(np.count_nonzero(~actual & predicted))
+            tn = int(np.count_nonzero(~actual & ~predicted))
             prec = tp/(tp+fp+1e-9)
             rec  = tp/(tp+fn+1e-9)
             f1   = 2*prec*rec/(prec+rec+1e-9)
@@ -107,6 +116,8 @@ POS_BY_DATE = {
     DATES[20].date(): {GIDS[2]},      
     DATES[25].date(): {GIDS[0]},     
 }
+# same events keyed on proleptic ordinal, avoids building a date per lookup
+POS_BY_ORD = {d.toordinal(): gids for d, gids in POS_BY_DATE.items()}
 
 EXT = Extent(104.5, 120.0, -10.0, -4.75)
 RES = Resolution(lat=128, lon=256)
@@ -121,7 +132,7 @@ class FakeStore:
     def __init__(self, events):
         self._events = events
     def get_events_on_date_gid2s(self, date):
-        return list(POS_BY_DATE.get(date.date(), []))
+        return list(POS_BY_ORD.get(date.toordinal(), []))
 
 
 # --------------- Run grid search ---------------
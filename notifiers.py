@@ -1,14 +1,12 @@
 import cartopy.feature as cfeature
 import matplotlib.pyplot as plt
-import geopandas as gpd
-import os
 import logging
 import numpy as np
 
 from interface import *
 from sources import *
 from indices import *
-from areas import map_grid_cells_to_areas
+from areas import map_grid_cells_to_areas, get_bandung_regency
 from flood_threat import alert_on_flood_threat
 
 logger = logging.getLogger(__name__)
@@ -26,14 +24,8 @@ class PlotNotifier(Notifier):
         ax = fig.add_subplot(1, 1, 1, projection=MAP_PROJECTION)
         ax.set_extent(notify_raster["h-mhews-flood-risk-index"].extent.as_tuple)
 
-        gdf = gpd.read_file(
-            os.path.join(
-                os.path.dirname(os.path.realpath(__file__)), "cadastre/gadm41_IDN_2.shp"
-            )
-        )
-
         # Plot Bandung outline.
-        bandung = gdf[(gdf["NAME_2"] == "Bandung") & (gdf["TYPE_2"] == "Kabupaten")]
+        bandung = get_bandung_regency()
         bandung.geometry.boundary.plot(ax=ax)
 
         notify_raster["h-mhews-flood-risk-index"].plot(ax, cmap="Reds")
@@ -103,9 +95,10 @@ class ConsoleAreaNotifier(Notifier):
             return
 
         logger.info(f"ConsoleAreaNotifier - Affected areas ({len(areas_gdf)}):")
-        # Currently printed at gadm level 3.
-        sorted_areas = areas_gdf.sort_values(by="NAME_3")
-        for row in sorted_areas.itertuples():
+        # Currently printed at gadm level 3. Only the printed columns are kept,
+        # so the geometry column is not copied while sorting.
+        sorted_areas = areas_gdf[["NAME_3", "GID_3"]].sort_values(by="NAME_3")
+        for row in sorted_areas.itertuples(index=False):
             logger.info(f"- {row.NAME_3}, GID: {row.GID_3}")
 
     @property
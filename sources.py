@@ -1,21 +1,32 @@
 #!/usr/env/python
 from datetime import timedelta, date
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+import functools
 import logging
+import os
+import typing
 
 import gzip
+import tempfile
 import rasterio
+import rasterio.shutil
+from rasterio.io import MemoryFile
+from rasterio.windows import Window, from_bounds
 import cartopy.crs as ccrs
 import numpy as np
 import requests_cache
 import xarray as xr
 from PIL import Image
-from pyproj import CRS
+from pyproj import CRS, Transformer
 from requests import Request
 from interface import Source, RasterizedInformation, Extent, Resolution
 from utils import (
+    CACHE_DIR,
+    cached_array,
     get_bbox_xy,
     reproject_gdal,
+    reproject_stack_gdal,
     _zoom_to_pixel_size,
 )
 
@@ -24,11 +35,44 @@ logger = logging.getLogger(__name__)
 
 PLATE_CARREE_EPSG = 32662
 
+# Constructing these parses PROJ definitions, so they are shared.
+PLATE_CARREE = ccrs.PlateCarree()
+PLATE_CARREE_CRS = CRS.from_epsg(PLATE_CARREE_EPSG)
+PLATE_CARREE_PROJECTION = ccrs.Projection(PLATE_CARREE_CRS)
+
+
+def _cache_backend():
+    """Returns the requests-cache backend for SESSION.
+
+    Sources are fetched concurrently, the default SQLite backend would serialize
+    their writes. Redis is used if `REDIS_URL` is set, otherwise the filesystem
+    backend, which stores every response in a separate file.
+    """
+    redis_url = os.environ.get("REDIS_URL")
+    if redis_url:
+        from redis import Redis
+
+        return requests_cache.RedisCache("fews", connection=Redis.from_url(redis_url))
+
+    return "filesystem"
+
+
+# How long fetched data is reused, both as HTTP responses and as decoded arrays
+BMKG_EXPIRE_AFTER = timedelta(days=1)
+BNPB_EXPIRE_AFTER = timedelta(days=7)
+
 SESSION = requests_cache.CachedSession(
     "fews",
+    backend=_cache_backend(),
     use_cache_dir=True,  # Save files in the default user cache dir
     cache_control=False,  # Use Cache-Control response headers for expiration, if available
     expire_after=timedelta(days=700),  # Otherwise expire responses after one day
+    urls_expire_after={
+        # Stored as COG by CHIRPSSource, caching the download would duplicate it.
+        "data.chc.ucsb.edu": requests_cache.DO_NOT_CACHE,
+        "gis.bmkg.go.id": BMKG_EXPIRE_AFTER,
+        "gis.bnpb.go.id": BNPB_EXPIRE_AFTER,
+    },
     allowable_codes=[
         200,
     ],
@@ -55,6 +99,10 @@ class BnpbSource(Source):
         self.IDENTIFIER = source_identifier
         self.bnpb_source = bnpb_source
         self.crs = ccrs.epsg(str(self.EPSG))
+        self._src_crs = CRS.from_epsg(self.EPSG)
+        self._to_plate_carree = Transformer.from_crs(
+            self.crs, "EPSG:4326", always_xy=True
+        )
 
     def _get_data(self, extent: Extent, resolution: Resolution):
         bbox = get_bbox_xy(extent.lon_range, extent.lat_range)
@@ -88,16 +136,112 @@ class BnpbSource(Source):
             return None
 
         i = Image.open(BytesIO(res.content))
+        # Decode once, all later accesses reuse the pixel data
+        i.load()
 
         return i
 
+    def _decode_data(self, extent: Extent, resolution: Resolution):
+        """Fetches a single image and decodes it into a float32 array."""
+        src_img = self._get_data(extent, resolution)
+        if src_img is None:
+            return None
+
+        logger.debug(f"{self.IDENTIFIER}: Image dimensions: {src_img.size}")
+        # It's a greyscale image, so a single luminance band suffices
+        src_data = np.asarray(src_img.convert("L"), dtype=np.float32)
+        src_data *= 1 / 255
+        return src_data
+
+    def _decode_tiled_data(self, extent: Extent, resolution: Resolution):
+        """Fetches an image larger than the server allows as tiles in parallel.
+
+        Tiles are requested with a one pixel border overlapping their
+        neighbours, which is cropped off, so the interpolation at the tile
+        edges matches that of a single large image.
+        """
+        height, width = resolution
+        psize_lon = (extent.lon_max - extent.lon_min) / width
+        psize_lat = (extent.lat_max - extent.lat_min) / height
+
+        # Leave room for the borders.
+        tile_height = self.MAX_IMAGE_HEIGHT - 2
+        tile_width = self.MAX_IMAGE_WIDTH - 2
+
+        tiles = []
+        for row_min in range(0, height, tile_height):
+            for col_min in range(0, width, tile_width):
+                row_max = min(row_min + tile_height, height)
+                col_max = min(col_min + tile_width, width)
+
+                # Pixel bounds including the border.
+                b_row_min, b_row_max = max(row_min - 1, 0), min(row_max + 1, height)
+                b_col_min, b_col_max = max(col_min - 1, 0), min(col_max + 1, width)
+
+                tile_extent = Extent(
+                    extent.lon_min + b_col_min * psize_lon,
+                    extent.lon_min + b_col_max * psize_lon,
+                    extent.lat_max - b_row_max * psize_lat,
+                    extent.lat_max - b_row_min * psize_lat,
+                )
+                tile_resolution = (b_row_max - b_row_min, b_col_max - b_col_min)
+                crop = (
+                    slice(row_min - b_row_min, row_max - b_row_min),
+                    slice(col_min - b_col_min, col_max - b_col_min),
+                )
+                tiles.append(
+                    (
+                        tile_extent,
+                        tile_resolution,
+                        crop,
+                        row_min,
+                        row_max,
+                        col_min,
+                        col_max,
+                    )
+                )
+
+        logger.debug(f"{self.IDENTIFIER}: fetching {len(tiles)} tiles")
+
+        output = np.empty((height, width), dtype=np.float32)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tile_data = executor.map(
+                lambda tile: self._decode_data(tile[0], tile[1]), tiles
+            )
+            for tile, data in zip(tiles, tile_data):
+                if data is None:
+                    return None
+
+                _, _, crop, row_min, row_max, col_min, col_max = tile
+                output[row_min:row_max, col_min:col_max] = data[crop]
+
+        return output
+
+    def _get_data_array(self, extent: Extent, resolution: Resolution):
+        """Fetches the data as a float32 array, the decoded array is cached on disk."""
+
+        def decode():
+            height, width = resolution
+            if height <= self.MAX_IMAGE_HEIGHT and width <= self.MAX_IMAGE_WIDTH:
+                return self._decode_data(extent, resolution)
+
+            return self._decode_tiled_data(extent, resolution)
+
+        key = (
+            self.IDENTIFIER,
+            self.bnpb_source,
+            tuple(map(float, extent.as_tuple)),
+            tuple(resolution),
+        )
+        return cached_array(key, decode, expire_after=BNPB_EXPIRE_AFTER)
+
     def image_for_domain(self, target_domain, zoom):
         target_domain = target_domain.bounds
         lon_min, lat_min, lon_max, lat_max = target_domain
         extent = lon_min, lon_max, lat_min, lat_max
 
-        _, lat_mean = ccrs.PlateCarree().transform_point(
-            (lon_max + lon_min) / 2, (lat_max + lat_min) / 2, self.crs
+        _, lat_mean = self._to_plate_carree.transform(
+            (lon_max + lon_min) / 2, (lat_max + lat_min) / 2
         )
 
         pixel_size = _zoom_to_pixel_size(zoom, lat_mean)
@@ -117,12 +261,12 @@ class BnpbSource(Source):
         dst_resolution: Resolution,
     ) -> RasterizedInformation:
         resampling = "bilinear"
-        src_crs = CRS.from_epsg(self.EPSG)
-        dst_crs = CRS.from_epsg(PLATE_CARREE_EPSG)
+        src_crs = self._src_crs
+        dst_crs = PLATE_CARREE_CRS
 
-        src_extent = dst_extent.reproject(ccrs.PlateCarree(), self.crs)
+        src_extent = dst_extent.reproject(PLATE_CARREE, self.crs)
         ang_extent = dst_extent
-        dst_extent = dst_extent.reproject(ccrs.PlateCarree(), ccrs.Projection(dst_crs))
+        dst_extent = dst_extent.reproject(PLATE_CARREE, PLATE_CARREE_PROJECTION)
 
         # Calculate pixel size (before growing src_extent)
         dst_psize_lon, dst_psize_lat = src_extent.pixel_size(dst_resolution)
@@ -131,18 +275,13 @@ class BnpbSource(Source):
         src_extent = src_extent.grow_extent(self.DATA_RESOLUTION)
 
         # Calculate required source resolution
-        src_resolution_lon = int(
-            (src_extent.lon_max - src_extent.lon_min) / dst_psize_lon
-        )
-        src_resolution_lat = int(
-            (src_extent.lat_max - src_extent.lat_min) / dst_psize_lat
-        )
+        lon_min, lon_max, lat_min, lat_max = src_extent.as_tuple
+        src_resolution_lon = int((lon_max - lon_min) / dst_psize_lon)
+        src_resolution_lat = int((lat_max - lat_min) / dst_psize_lat)
 
-        src_img = self._get_data(src_extent, (src_resolution_lat, src_resolution_lon))
-        logger.debug(f"{self.IDENTIFIER}: Image dimensions: {np.array(src_img).shape}")
-        # Combine RGB channels as it's a greyscale image
-        # src_data = np.sum(src_img, axis=2, dtype=np.float32)
-        src_data = np.array(src_img, dtype=np.float32)[:, :, 0] / 255
+        src_data = self._get_data_array(
+            src_extent, (src_resolution_lat, src_resolution_lon)
+        )
 
         output = reproject_gdal(
             src_data,
@@ -194,15 +333,37 @@ class NOAAGfsSource(Source):
         self.hours_ahead = hours_ahead
         self.dataset = dataset
 
-    def _get_data(self, extent: Extent):
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _open_dataset(date, cycle) -> xr.Dataset:
+        """Opens the OpenDAP dataset of a GFS cycle.
+
+        Opening fetches and parses the dataset's metadata. A published cycle
+        never changes, so the handle is shared by all sources of the same cycle.
+        """
+        url = f"https://nomads.ncep.noaa.gov/dods/gfs_0p25/gfs{date}/gfs_0p25_{cycle}z"
+        return xr.open_dataset(url, decode_coords="all")
+
+    def _get_data(self, extent: Extent, hours_ahead=None):
+        """Selects the data of `extent`, lazily.
+
+        `hours_ahead` defaults to the hours ahead of this source, a list of
+        hours selects a stack of time-slices in a single request.
+        """
         lon_min, lon_max, lat_min, lat_max = extent.as_tuple
 
-        url = f"https://nomads.ncep.noaa.gov/dods/gfs_0p25/gfs{self.date}/gfs_0p25_{self.cycle}z"
-        ds = xr.open_dataset(url, decode_coords="all")
+        if hours_ahead is None:
+            hours_ahead = self.hours_ahead
+
+        ds = self._open_dataset(self.date, self.cycle)
 
         # Select the accumulated precipitation at surface ('apcpsfc') for the 6-hour forecast
         # This could be done on initialization, or at least be cached after a single fetch
-        prediction = ds[self.dataset].sel(time=ds.time[self.hours_ahead // 3])
+        if isinstance(hours_ahead, int):
+            time = ds.time[hours_ahead // 3]
+        else:
+            time = ds.time[[hours // 3 for hours in hours_ahead]]
+        prediction = ds[self.dataset].sel(time=time)
 
         prediction_in_region = prediction.sel(
             lat=slice(lat_min, lat_max), lon=slice(lon_min, lon_max)
@@ -227,9 +388,11 @@ class NOAAGfsSource(Source):
 
         data = prediction_in_region.values
 
-        uint8_data = (
-            (data - np.nanmin(data)) / (np.nanmax(data) - np.nanmin(data)) * 255
-        ).astype(np.uint8)
+        # Scale to 0-255 with a single temporary array.
+        data_min, data_max = np.nanmin(data), np.nanmax(data)
+        scaled = np.subtract(data, data_min, dtype=np.float32)
+        scaled *= 255 / (data_max - data_min)
+        uint8_data = scaled.astype(np.uint8)
         img = Image.fromarray(uint8_data, "L")
 
         return img, extent, "lower"
@@ -244,30 +407,46 @@ class NOAAGfsSource(Source):
 
         Returns a two dimensional array of shape resolution
         """
-        src_crs = CRS.from_epsg(PLATE_CARREE_EPSG)
-        dst_crs = CRS.from_epsg(PLATE_CARREE_EPSG)
+        return self.fetch_data_hours(
+            [self.hours_ahead], dst_extent, dst_resolution, resampling
+        )[0]
+
+    def fetch_data_hours(
+        self,
+        hours_ahead: typing.List[int],
+        dst_extent: Extent,
+        dst_resolution: Resolution,
+        resampling: str = "bilinear",
+    ) -> typing.List[RasterizedInformation]:
+        """Fetches the data of this cycle for several hours ahead at once.
 
-        src_extent = dst_extent.reproject(ccrs.PlateCarree(), self.crs)
+        The time-slices are fetched in a single request and share a single
+        reprojection.
+        """
+        src_crs = PLATE_CARREE_CRS
+        dst_crs = PLATE_CARREE_CRS
+
+        src_extent = dst_extent.reproject(PLATE_CARREE, self.crs)
 
         # Grow extent if necessary to match data resolution
         src_extent = src_extent.grow_extent(self.DATA_RESOLUTION)
 
-        src_data = self._get_data(src_extent)  # get source data
+        src_data = self._get_data(src_extent, hours_ahead)  # get source data
+        # The data is stored south to north, flip it while it's still lazy so
+        # only the selected region is fetched and no extra copy is made.
+        src_data = src_data.isel(lat=slice(None, None, -1)).load()
 
         # Reproject extents from angles to meters
-        src_extent = src_extent.reproject(
-            ccrs.PlateCarree(),
-            ccrs.Projection(src_crs),
-        )
+        src_extent = src_extent.reproject(PLATE_CARREE, PLATE_CARREE_PROJECTION)
         ang_extent = dst_extent
-        dst_extent = dst_extent.reproject(ccrs.PlateCarree(), ccrs.Projection(dst_crs))
+        dst_extent = dst_extent.reproject(PLATE_CARREE, PLATE_CARREE_PROJECTION)
 
         logger.debug(
             f"{self.IDENTIFIER}: Data range: {np.min(src_data.values)}, {np.max(src_data.values)}"
         )
 
-        output = reproject_gdal(
-            np.flipud(src_data.values),
+        output = reproject_stack_gdal(
+            src_data.values,
             src_crs,
             src_extent,
             dst_resolution,
@@ -276,7 +455,7 @@ class NOAAGfsSource(Source):
             resampling,
         )
 
-        return RasterizedInformation(ang_extent, output)
+        return [RasterizedInformation(ang_extent, data) for data in output]
 
     @property
     def max_resolution(self):
@@ -298,14 +477,18 @@ class BmkgSource(Source):
             self.crs = ccrs.GOOGLE_MERCATOR
         else:
             self.crs = ccrs.epsg(self.EPSG)
+        self._src_crs = CRS.from_epsg(self.EPSG)
+        self._to_plate_carree = Transformer.from_crs(
+            self.crs, "EPSG:4326", always_xy=True
+        )
 
     def image_for_domain(self, target_domain, zoom):
         target_domain = target_domain.bounds
         lon_min, lat_min, lon_max, lat_max = target_domain
         extent = lon_min, lon_max, lat_min, lat_max
 
-        _, lat_mean = ccrs.PlateCarree().transform_point(
-            (lon_max + lon_min) / 2, (lat_max + lat_min) / 2, self.crs
+        _, lat_mean = self._to_plate_carree.transform(
+            (lon_max + lon_min) / 2, (lat_max + lat_min) / 2
         )
 
         pixel_size = _zoom_to_pixel_size(zoom, lat_mean)
@@ -325,21 +508,16 @@ class BmkgSource(Source):
         resolution: Resolution,
         resampling: str,
     ) -> np.ndarray:
-        src_crs = CRS.from_epsg(self.EPSG)
-        dst_crs = CRS.from_epsg(PLATE_CARREE_EPSG)
+        src_crs = self._src_crs
+        dst_crs = PLATE_CARREE_CRS
 
-        src_extent = dst_extent.reproject(ccrs.PlateCarree(), self.crs)
-        dst_extent = dst_extent.reproject(ccrs.PlateCarree(), ccrs.Projection(dst_crs))
+        src_extent = dst_extent.reproject(PLATE_CARREE, self.crs)
+        dst_extent = dst_extent.reproject(PLATE_CARREE, PLATE_CARREE_PROJECTION)
 
         assert resolution[0] <= self.MAX_IMAGE_HEIGHT
         assert resolution[1] <= self.MAX_IMAGE_WIDTH
 
-        src_img = self._get_data(src_extent, resolution)
-
-        logger.debug(f"{self.IDENTIFIER}: image dimensions: {np.array(src_img).shape}")
-
-        # Combine RGB channels as it's a greyscale image
-        src_data = np.sum(src_img, axis=2, dtype=np.float32)
+        src_data = self._get_data_array(src_extent, resolution)
 
         logger.debug(
             f"{self.IDENTIFIER}: data range: {np.min(src_data)}, {np.max(src_data)}"
@@ -386,24 +564,47 @@ class BmkgSource(Source):
             "bbox": bbox,
             "width": RESOLUTION,
             "height": RESOLUTION,
-            "format": "image/png",
         }
 
-        req = SESSION.get(base_url, params=params)
+        # Prefer an 8-bit palette PNG, which is a fraction of the size of the
+        # default RGBA PNG, but not every WMS server supports it.
+        for image_format in ("image/png; mode=8bit", "image/png"):
+            params["format"] = image_format
+            req = SESSION.get(base_url, params=params)
+
+            if req.headers.get("Content-Type", "").startswith("image/png"):
+                break
 
-        if req.headers.get("Content-Type") != "image/png":
+            logger.debug(f"{self.IDENTIFIER}: format {image_format} not supported")
+        else:
             logger.error(f"{self.IDENTIFIER}: fetching failed")
             logger.error(req.text)
             return None
 
         i = Image.open(BytesIO(req.content))
+        # Decode once, all later accesses reuse the pixel data
+        i.load()
 
-        x = np.array(i)
-
-        logger.debug(f"{self.IDENTIFIER}: data range: {np.min(x)}, {np.max(x)}")
+        logger.debug(f"{self.IDENTIFIER}: data range: {i.getextrema()}")
 
         return i
 
+    def _get_data_array(self, extent: Extent, resolution: Resolution):
+        """Fetches the data as a float32 array, the decoded array is cached on disk."""
+
+        def decode():
+            src_img = self._get_data(extent, resolution)
+            if src_img is None:
+                return None
+
+            logger.debug(f"{self.IDENTIFIER}: image dimensions: {src_img.size}")
+
+            # It's a greyscale image, so a single luminance band suffices
+            return np.asarray(src_img.convert("L"), dtype=np.float32)
+
+        key = (self.IDENTIFIER, tuple(map(float, extent.as_tuple)), tuple(resolution))
+        return cached_array(key, decode, expire_after=BMKG_EXPIRE_AFTER)
+
 
 class CHIRPSSource(Source):
     IDENTIFIER = "chirps-historical-rain-data"
@@ -415,8 +616,57 @@ class CHIRPSSource(Source):
     def __init__(self, date: date):
         self.crs = ccrs.GOOGLE_MERCATOR
         self.date = date
+        self._src_crs = CRS.from_epsg(self.EPSG)
+        self._src_projection = ccrs.Projection(self._src_crs)
+
+    def _window_extent(self, extent: Extent) -> Extent:
+        """Snaps `extent` (in degrees) outwards to the data grid, with a margin
+        of one grid cell for interpolation, clipped to the data extent."""
+        extent = extent.grow_extent(self.DATA_RESOLUTION)
+
+        return Extent(
+            max(extent.lon_min - self.DATA_RESOLUTION, self.DATA_EXTENT.lon_min),
+            min(extent.lon_max + self.DATA_RESOLUTION, self.DATA_EXTENT.lon_max),
+            max(extent.lat_min - self.DATA_RESOLUTION, self.DATA_EXTENT.lat_min),
+            min(extent.lat_max + self.DATA_RESOLUTION, self.DATA_EXTENT.lat_max),
+        )
+
+    def _get_data(self, extent: Extent):
+        """Fetches the grid cells covering `extent` (in degrees).
+
+        Returns the data and its extent, which is `extent` snapped to the data
+        grid. Only the blocks of the cached COG that cover the extent are read.
+        """
+        window_extent = self._window_extent(extent)
+
+        path = self._get_cog()
+        if path is None:
+            return None, window_extent
+
+        with rasterio.open(path) as i:
+            logger.debug(f"{self.IDENTIFIER}: data CRS: {i.crs}")
+            window = from_bounds(*window_extent.bounds, transform=i.transform)
+            window = Window(
+                round(window.col_off),
+                round(window.row_off),
+                round(window.width),
+                round(window.height),
+            )
+            return i.read(1, window=window), window_extent
+
+    def _get_cog(self):
+        """Returns the path of the day's global grid as a Cloud-Optimized GeoTIFF.
+
+        The gzipped GeoTIFF is downloaded and converted on first use, afterwards
+        the tiled, compressed COG is read from the cache directory.
+        """
+        path = os.path.join(
+            CACHE_DIR, "chirps", f"{self.date.strftime('%Y.%m.%d')}.tif"
+        )
+        if os.path.exists(path):
+            logger.debug(f"{self.IDENTIFIER}: cache hit for {path}")
+            return path
 
-    def _get_data(self):
         req = Request(
             "GET",
             f"https://data.chc.ucsb.edu/products/CHIRPS-2.0/global_daily/tifs/p05/{self.date.year}/chirps-v2.0.{self.date.strftime('%Y.%m.%d')}.tif.gz",
@@ -429,16 +679,24 @@ class CHIRPSSource(Source):
             logger.error(res.text)
             return None
 
-        if res.from_cache:
-            logger.debug(f"{self.IDENTIFIER}: cache hit for {req.url}")
-        else:
-            logger.debug(f"{self.IDENTIFIER}: cache miss for {req.url}")
-
-        decompressed = gzip.open(BytesIO(res.content))
-
-        i = rasterio.open(decompressed)
-        logger.debug(f"{self.IDENTIFIER}: data CRS: {i.crs}")
-        return i.read(1)
+        # Write to a temporary file first so concurrent readers never see a
+        # partially written file.
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tif")
+        os.close(fd)
+        with MemoryFile(gzip.decompress(res.content)) as memfile:
+            with memfile.open() as i:
+                rasterio.shutil.copy(
+                    i,
+                    tmp_path,
+                    driver="COG",
+                    BLOCKSIZE=512,
+                    COMPRESS="DEFLATE",
+                    PREDICTOR=2,
+                )
+        os.replace(tmp_path, path)
+
+        return path
 
     def image_for_domain(self, target_domain, zoom):
         pass
@@ -449,23 +707,37 @@ class CHIRPSSource(Source):
         dst_resolution: Resolution,
         resampling: str = "bilinear",
     ) -> np.ndarray:
-        src_crs = CRS.from_epsg(self.EPSG)
-        dst_crs = CRS.from_epsg(PLATE_CARREE_EPSG)
+        return self._data_for_dates([self], dst_extent, dst_resolution, resampling)[0]
 
-        src_extent = self.DATA_EXTENT.reproject(
-            ccrs.PlateCarree(), ccrs.Projection(src_crs)
-        )
-        dst_extent = dst_extent.reproject(ccrs.PlateCarree(), ccrs.Projection(dst_crs))
+    @staticmethod
+    def _data_for_dates(
+        sources: typing.List["CHIRPSSource"],
+        dst_extent: Extent,
+        dst_resolution: Resolution,
+        resampling: str = "bilinear",
+    ) -> np.ndarray:
+        """Reprojects the data of all `sources` as a single stack.
 
-        # Grow extent if necessary to match data resolution
-        # src_extent = grow_extent(src_extent, self.DATA_RESOLUTION)
+        All days share the same grid, so one warp covers all of them.
+        """
+        src_crs = sources[0]._src_crs
+        src_projection = sources[0]._src_projection
+        dst_crs = PLATE_CARREE_CRS
 
-        src_data = self._get_data()
-        src_data[src_data < 0] = 0
-        logger.debug(f"{self.IDENTIFIER}: got data! {src_data.shape}")
-        logger.debug(f"{self.IDENTIFIER}: data CRS {self.crs}")
+        src_data = []
+        for source in sources:
+            data, src_extent = source._get_data(dst_extent)
+            data[data < 0] = 0
+            src_data.append(data)
+        src_data = np.stack(src_data)
 
-        output = reproject_gdal(
+        src_extent = src_extent.reproject(PLATE_CARREE, src_projection)
+        dst_extent = dst_extent.reproject(PLATE_CARREE, PLATE_CARREE_PROJECTION)
+
+        logger.debug(f"{CHIRPSSource.IDENTIFIER}: got data! {src_data.shape}")
+        logger.debug(f"{CHIRPSSource.IDENTIFIER}: data CRS {sources[0].crs}")
+
+        output = reproject_stack_gdal(
             src_data,
             src_crs,
             src_extent,
@@ -484,6 +756,19 @@ class CHIRPSSource(Source):
     ) -> RasterizedInformation:
         return RasterizedInformation(extent, self.data_for_domain(extent, resolution))
 
+    @classmethod
+    def fetch_data_dates(
+        cls,
+        dates: typing.List[date],
+        extent: Extent,
+        resolution: Resolution,
+    ) -> typing.List[RasterizedInformation]:
+        """Fetches the data of several days at once, sharing a single
+        reprojection."""
+        output = cls._data_for_dates([cls(d) for d in dates], extent, resolution)
+
+        return [RasterizedInformation(extent, data) for data in output]
+
     # TODO: Verify correctness.
     @property
     def max_resolution(self):
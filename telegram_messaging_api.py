@@ -1,7 +1,13 @@
 from flask import Flask, request, jsonify
+from json_provider import use_fast_json
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import logging
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 
 # Set default encoding to utf-8
@@ -13,10 +19,41 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(level
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
+use_fast_json(app)
 
 # Global variable to store the bot token
 BOT_TOKEN = 'place token here'
 
+# Shared session, keeps the connection to api.telegram.org alive between alerts
+POOL_SIZE = 20
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=POOL_SIZE, max_retries=Retry(total=3, backoff_factor=0.2)))
+atexit.register(_session.close)
+
+# English alert strings, translated per language by `_templates`
+_BASE_TEMPLATES = {
+    'alert_title': "FLOOD ALERT!",
+    'threat_detected': "Imminent flood threat detected with hazard index of",
+    'affected_regions': "Affected regions",
+    'take_precautions': "Please take necessary precautions immediately.",
+}
+
+@functools.lru_cache(maxsize=64)
+def _validate_token(token):
+    """Verifies the token with the getMe API call and returns the bot's username.
+
+    Raises ValueError if Telegram rejects the token. Exceptions are not cached,
+    so a failed check is retried on the next call.
+    """
+    response = _session.get(f"https://api.telegram.org/bot{token}/getMe")
+    response.raise_for_status()
+    bot_info = response.json()
+
+    if not bot_info.get("ok"):
+        raise ValueError(bot_info.get('description', 'Unknown error'))
+
+    return bot_info['result']['username']
+
 def setup_telegram_config(token):
 
     global BOT_TOKEN
@@ -24,16 +61,12 @@ def setup_telegram_config(token):
     
     # Verify that the token works by making a simple API call
     try:
-        response = requests.get(f"https://api.telegram.org/bot{BOT_TOKEN}/getMe")
-        response.raise_for_status()
-        bot_info = response.json()
-        
-        if bot_info.get("ok"):
-            logger.info(f"Telegram bot configured successfully: @{bot_info['result']['username']}")
-            return True
-        else:
-            logger.error(f"Failed to configure Telegram bot: {bot_info.get('description', 'Unknown error')}")
-            return False
+        username = _validate_token(BOT_TOKEN)
+        logger.info(f"Telegram bot configured successfully: @{username}")
+        return True
+    except ValueError as e:
+        logger.error(f"Failed to configure Telegram bot: {str(e)}")
+        return False
     except Exception as e:
         logger.error(f"Error setting up Telegram bot: {str(e)}")
         return False
@@ -55,7 +88,7 @@ def send_telegram_message(chat_id, message):
             "parse_mode": "HTML"  # Supports HTML formatting in messages
         }
         
-        response = requests.post(url, json=payload)
+        response = _session.post(url, json=payload)
         response.raise_for_status()
         result = response.json()
         
@@ -72,6 +105,15 @@ def send_telegram_message(chat_id, message):
         logger.error(error_msg)
         return {"status": "error", "message": error_msg}
 
+def send_telegram_messages(chat_ids, message):
+    """Sends the same message to several chats concurrently, returns the result per chat."""
+    if not chat_ids:
+        return []
+
+    # At most one request per pooled connection
+    with ThreadPoolExecutor(max_workers=min(len(chat_ids), POOL_SIZE)) as executor:
+        return list(executor.map(lambda chat_id: send_telegram_message(chat_id, message), chat_ids))
+
 # Flask routes
 @app.route('/send_alert', methods=['POST'])
 def send_alert():
@@ -102,6 +144,23 @@ def send_alert():
     else:
         return jsonify(result), 500
 
+@functools.lru_cache(maxsize=64)
+def _templates(language):
+    """Returns the alert strings translated to `language`."""
+    # Imported here, flood_threat imports this module
+    from flood_threat import translate_message
+
+    return {key: translate_message(message, language) for key, message in _BASE_TEMPLATES.items()}
+
+@functools.lru_cache(maxsize=512)
+def _build_alert_html(language, hazard_index_text, affected_regions):
+    """Formats the HTML alert message, shared by all chats alerted with the same values."""
+    templates = _templates(language)
+
+    regions_text = f"\n\n<b>{templates['affected_regions']}:</b> {affected_regions}" if affected_regions else ""
+
+    return f"<b>🚨 {templates['alert_title']}</b>\n\n{templates['threat_detected']} <b>{hazard_index_text}</b>.{regions_text}\n\n{templates['take_precautions']}"
+
 def send_flood_alert(hazard_index, chat_id, affected_regions=None, language='en'):
 
     ##Send a specific flood alert message with the hazard index and affected regions.
@@ -111,19 +170,7 @@ def send_flood_alert(hazard_index, chat_id, affected_regions=None, language='en'
         logger.error("chat_id must be provided")
         return {"status": "error", "message": "chat_id must be provided"}
 
-    from flood_threat import translate_message, format_alert_message
-
-    templates = {
-        'alert_title': translate_message("FLOOD ALERT!", language),
-        'threat_detected': translate_message("Imminent flood threat detected with hazard index of", language),
-        'affected_regions': translate_message("Affected regions", language),
-        'take_precautions': translate_message("Please take necessary precautions immediately.", language),
-    }
-    
-
-    regions_text = f"\n\n<b>{templates['affected_regions']}:</b> {affected_regions}" if affected_regions else ""
-    
-    message = f"<b>🚨 {templates['alert_title']}</b>\n\n{templates['threat_detected']} <b>{hazard_index:.2f}</b>.{regions_text}\n\n{templates['take_precautions']}"
+    message = _build_alert_html(language, f"{hazard_index:.2f}", affected_regions)
     
     # Log the alert
     logger.info(f"Sending flood alert with hazard index {hazard_index:.2f} for regions: {affected_regions or 'Unknown'} in {language}")
@@ -131,6 +178,16 @@ def send_flood_alert(hazard_index, chat_id, affected_regions=None, language='en'
     # Send the message
     return send_telegram_message(chat_id, message)
 
+def broadcast_flood_alert(hazard_index, chat_ids, affected_regions=None, language='en'):
+
+    ##Send the same flood alert to several chats at once, the message is formatted only once.
+
+    message = _build_alert_html(language, f"{hazard_index:.2f}", affected_regions)
+
+    logger.info(f"Broadcasting flood alert with hazard index {hazard_index:.2f} to {len(chat_ids)} chats in {language}")
+
+    return send_telegram_messages(chat_ids, message)
+
 if __name__ == "__main__":
     # For testing purposes
     print("Starting Telegram Messaging API")
@@ -138,4 +195,4 @@ if __name__ == "__main__":
     setup_telegram_config("YOUR_BOT_TOKEN_HERE")
     send_flood_alert(0.85, "YOUR_CHAT_ID_HERE")
     # Or to run the Flask server:
-    app.run(debug=True, port=5001)  # Using port 5001 to avoid conflict with WhatsApp API
+    app.run(debug=True, port=5001, threaded=True)  # Using port 5001 to avoid conflict with WhatsApp API
@@ -1,12 +1,17 @@
 import typing
+import functools
 import os
+import hashlib
+import tempfile
 from datetime import datetime, timedelta
 import numpy as np
 
 from interface import Resolution, Extent
 from pyproj import CRS
-from osgeo import gdal, osr
-import cartopy.crs as ccrs
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "igs"
+)
 
 
 def _zoom_to_pixel_size(zoom: int, lat: float):
@@ -16,6 +21,8 @@ def _zoom_to_pixel_size(zoom: int, lat: float):
     """
     import math
 
+    import cartopy.crs as ccrs
+
     circumference = ccrs.WGS84_SEMIMAJOR_AXIS * 2 * math.pi
     pixel_size = circumference * math.cos(lat / 180 * math.pi) / (2 ** (zoom + 8))
 
@@ -30,6 +37,36 @@ def get_bbox_xy(x: typing.Tuple[float, float], y: typing.Tuple[float, float]) ->
     return f"{x[0]:.6f},{y[0]:.6f},{x[1]:.6f},{y[1]:.6f}"
 
 
+@functools.cache
+def _gdal():
+    """Imports and configures GDAL on first use.
+
+    GDAL is slow to import and only needed to reproject, while most modules
+    import utils for its small helpers.
+    """
+    from osgeo import gdal
+
+    # Keep recently read blocks in GDAL's block cache, unless configured otherwise
+    if "GDAL_CACHEMAX" not in os.environ:
+        gdal.SetCacheMax(512 << 20)
+
+    return gdal
+
+
+@functools.lru_cache(maxsize=32)
+def _srs_wkt(srs: str) -> str:
+    """Returns the WKT of a spatial reference given in any form GDAL accepts,
+    e.g. "EPSG:4326".
+
+    Cached, as the sources reproject between the same few CRSs on every fetch.
+    """
+    from osgeo import osr
+
+    spatial_ref = osr.SpatialReference()
+    spatial_ref.SetFromUserInput(srs)
+    return spatial_ref.ExportToWkt()
+
+
 def reproject_gdal(
     src_data: np.ndarray,
     src_crs: CRS,
@@ -38,22 +75,71 @@ def reproject_gdal(
     dst_crs: CRS,
     dst_extent: Extent,
     resampling: str,
+    num_threads: typing.Union[int, str] = "ALL_CPUS",
+    warp_mem_limit: int = 512,
 ):
-    assert src_data.dtype == np.float32
+    """Reprojects `src_data` to `dst_crs` using GDAL.
 
-    driver = gdal.GetDriverByName("MEM")
-    src_ds = driver.Create(
-        "", src_data.shape[1], src_data.shape[0], 1, gdal.GDT_Float32
-    )
-    src_ds.GetRasterBand(1).WriteArray(src_data)
+    The warp is split over `num_threads` threads (an int or "ALL_CPUS"), using
+    at most `warp_mem_limit` MB as working buffer.
+
+    If the source already matches the destination grid, the identity
+    reprojection is skipped and `src_data` is returned as is.
+    """
+    return reproject_stack_gdal(
+        src_data[np.newaxis],
+        src_crs,
+        src_extent,
+        dst_resolution,
+        dst_crs,
+        dst_extent,
+        resampling,
+        num_threads,
+        warp_mem_limit,
+    )[0]
+
+
+def reproject_stack_gdal(
+    src_stack: np.ndarray,
+    src_crs: CRS,
+    src_extent: Extent,
+    dst_resolution: Resolution,
+    dst_crs: CRS,
+    dst_extent: Extent,
+    resampling: str,
+    num_threads: typing.Union[int, str] = "ALL_CPUS",
+    warp_mem_limit: int = 512,
+):
+    """Reprojects a stack of rasters of shape (bands, lat, lon) sharing the
+    same grid, see `reproject_gdal`.
+
+    All bands go through a single warp, so the coordinate transformation is
+    only computed once for the whole stack.
+    """
+    assert src_stack.dtype == np.float32
+    assert src_stack.ndim == 3
+
+    bands, yn, xn = src_stack.shape
+
+    if (
+        (yn, xn) == (dst_resolution.lat, dst_resolution.lon)
+        and src_extent == dst_extent
+        and src_crs == dst_crs
+    ):
+        return src_stack
+
+    from osgeo import gdal_array
+
+    gdal = _gdal()
+
+    # Wraps the array's buffer in place, it has to be C-contiguous for that
+    src_stack = np.ascontiguousarray(src_stack)
+    src_ds = gdal_array.OpenArray(src_stack)
 
     # Define spatial reference and geo-transform
-    src_srs = osr.SpatialReference()
-    src_srs.ImportFromEPSG(src_crs.to_epsg())
-    src_ds.SetProjection(src_srs.ExportToWkt())
+    src_ds.SetProjection(_srs_wkt(src_crs.srs))
 
-    xn, yn = src_data.shape
-    src_resolution = Resolution(lon=yn, lat=xn)
+    src_resolution = Resolution(lon=xn, lat=yn)
 
     pixel_width, pixel_height = src_extent.pixel_size(src_resolution)
 
@@ -61,8 +147,7 @@ def reproject_gdal(
         [src_extent.lon_min, pixel_width, 0, src_extent.lat_max, 0, -pixel_height]
     )
 
-    dst_srs = osr.SpatialReference()
-    dst_srs.ImportFromEPSG(dst_crs.to_epsg())
+    dst_srs = _srs_wkt(dst_crs.srs)
 
     warped_ds = gdal.Warp(
         "",  # in-memory output
@@ -75,11 +160,17 @@ def reproject_gdal(
         outputBounds=dst_extent.bounds,
         dstNodata=np.nan,
         outputBoundsSRS=dst_srs,
+        multithread=True,
+        warpOptions=[f"NUM_THREADS={num_threads}"],
+        warpMemoryLimit=warp_mem_limit,
     )
 
-    warped_array = warped_ds.GetRasterBand(1).ReadAsArray()
+    # Read all bands at once, straight into a single (bands, lat, lon) array
+    warped_stack = warped_ds.ReadAsArray().reshape(
+        bands, dst_resolution.lat, dst_resolution.lon
+    )
 
-    return warped_array
+    return warped_stack
 
 
 def tile_to_mercator(x_tile: int, y_tile: int, zoom: int):
@@ -97,6 +188,74 @@ def tile_to_mercator(x_tile: int, y_tile: int, zoom: int):
     return lon, lat
 
 
+def tiles_to_mercator(x_tiles: np.ndarray, y_tiles: np.ndarray, zoom: int):
+    """Vectorized `tile_to_mercator`, maps arrays of tile coordinates at once.
+
+    Use `np.meshgrid` to map a whole grid of tiles.
+    """
+    n = 2**zoom
+
+    lon = np.asarray(x_tiles) * 360 / n - 180
+    lat = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * np.asarray(y_tiles) / n))))
+
+    return lon, lat
+
+
+def cached_array(
+    key: typing.Hashable,
+    compute: typing.Callable[[], typing.Optional[np.ndarray]],
+    expire_after: timedelta = timedelta(days=7),
+) -> typing.Optional[np.ndarray]:
+    """Memoizes the array returned by `compute` on disk, keyed on `repr(key)`.
+
+    Cached arrays are memory-mapped copy-on-write, so they are only paged in
+    when read and can be modified without touching the cache. Results of
+    `None` (i.e., failed fetches) are not cached. Arrays older than
+    `expire_after` are recomputed and removed from the cache.
+    """
+    # Arrays are grouped by expiry, so the whole directory can be pruned at once
+    cache_dir = os.path.join(
+        CACHE_DIR, "arrays", str(int(expire_after.total_seconds()))
+    )
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    path = os.path.join(cache_dir, f"{digest}.npy")
+
+    try:
+        age = datetime.now().timestamp() - os.path.getmtime(path)
+        if age < expire_after.total_seconds():
+            return np.load(path, mmap_mode="c")
+    except (OSError, ValueError):
+        pass
+
+    array = compute()
+    if array is None:
+        return None
+
+    # Write to a temporary file first so concurrent readers never see a
+    # partially written array.
+    os.makedirs(cache_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as f:
+        np.save(f, array)
+    os.replace(f.name, path)
+
+    _prune(cache_dir, expire_after)
+
+    return array
+
+
+def _prune(cache_dir: str, expire_after: timedelta):
+    """Removes the files in `cache_dir` older than `expire_after`."""
+    expired = datetime.now().timestamp() - expire_after.total_seconds()
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < expired:
+                    os.remove(entry.path)
+            except OSError:
+                # Removed by a concurrent prune
+                pass
+
+
 def get_file_path(filename):
     return os.path.join(os.path.dirname(os.path.realpath(__file__)), filename)
 
@@ -1,10 +1,26 @@
 from flask import Flask, request, jsonify
+from json_provider import use_fast_json
+import atexit
+import functools
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 import pywhatkit
+import queue
+import random
+import re
+import threading
 import time
 import datetime
 import logging
 import sys
 import os
+import uuid
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from urllib3.util.retry import Retry
 import webbrowser
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -12,7 +28,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException
 
 # Public exports
 __all__ = ['send_flood_alert', 'send_whatsapp_message']
@@ -27,131 +43,529 @@ sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 # Flask app
 app = Flask(__name__)
+use_fast_json(app)
 
 # Global settings
+_PREFIX = "⚠️ IMPORTANT MESSAGE ⚠️\n\n"
+_PHONE_RE = re.compile(r"\D+")
 PROFILE_DIR = "./whatsapp_persistent_profile"
-HAS_AUTHENTICATED = False
 WAIT_TIME = 30
 
+# Transient failures are retried with exponential backoff and jitter (in seconds)
+SEND_ATTEMPTS = 3
+RETRY_INITIAL_DELAY = 0.5
+RETRY_MAX_DELAY = 5
 
-def send_whatsapp_message(phone_number, message, group_id=None):
+# Save a screenshot of every message sent through the browser (WA_DEBUG_SCREENSHOT=1)
+DEBUG_SCREENSHOT = bool(os.environ.get("WA_DEBUG_SCREENSHOT"))
 
-    full_message = f"⚠️ IMPORTANT MESSAGE ⚠️\n\n{message}"
+# Run Chrome without a window (WA_HEADLESS=1), only possible once the profile is
+# logged in, as the QR code has to be scanned in the window
+HEADLESS = os.environ.get("WA_HEADLESS") == "1"
+CHROME_ARGUMENTS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-background-networking",
+    "--disable-renderer-backgrounding",
+    "--window-size=1280,720",
+)
+
+# Use persistent profile to maintain login session
+os.makedirs(PROFILE_DIR, exist_ok=True)
+
+# Browser settings, the same for every browser started
+_CHROME_OPTIONS = Options()
+_CHROME_OPTIONS.add_argument(f"--user-data-dir={PROFILE_DIR}")
+
+# Only WhatsApp Web itself is needed, skip everything else Chrome does
+for _argument in CHROME_ARGUMENTS:
+    _CHROME_OPTIONS.add_argument(_argument)
+_CHROME_OPTIONS.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+if HEADLESS:
+    _CHROME_OPTIONS.add_argument("--headless=new")
+    _CHROME_OPTIONS.add_argument("--no-sandbox")
+
+# Locators of WhatsApp Web elements. CSS selectors are faster than XPath, which
+# is only used where an element is matched on its text
+_LOC_SEARCH = (By.CSS_SELECTOR, "div[contenteditable='true'][data-tab='3']")
+_LOC_INPUT = (By.CSS_SELECTOR, "div[contenteditable='true'][data-tab='10']")
+
+# Locators of the message input box, in order of preference
+_WA_SELECTORS = (
+    _LOC_INPUT,
+    (By.CSS_SELECTOR, "footer div[contenteditable='true']"),
+)
+
+# Join button of a group invitation, messages sent in the chat, and the tick of
+# a sent message (a clock is shown until it is sent)
+_JOIN_LOCATOR = (By.XPATH, "//div[contains(text(), 'Join') or contains(text(), 'join')]")
+_OUTGOING_LOCATOR = (By.CSS_SELECTOR, "div.message-out")
+_SENT_LOCATOR = (By.CSS_SELECTOR, "span[data-icon^='msg-check'], span[data-icon^='msg-dblcheck']")
+
+# Messages to many recipients are queued and sent in batches, see queue_whatsapp_messages
+OUTBOX_BATCH_SIZE = 50
+_OUTBOX = queue.Queue()
+_SEND_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="whatsapp-send")
+_outbox_thread = None
+
+# pywhatkit types into the browser on the desktop, so only one fallback may run at a
+# time, see _fallback_executor
+_fallback_executor_instance = None
+_fallback_lock = threading.Lock()
+
+# Status of queued sends by job id, only the most recent MAX_JOBS are kept
+MAX_JOBS = 10_000
+_JOBS = OrderedDict()
+_jobs_lock = threading.Lock()
+
+# Browser logged in to WhatsApp Web, shared by all messages, see _get_driver
+_driver = None
+_driver_lock = threading.Lock()
+
+# Messages are sent through the WhatsApp Cloud API when it is configured, with
+# WhatsApp Web in a browser as fallback. Set WA_BACKEND=selenium to only use
+# the browser (e.g. during development)
+WA_CLOUD_TOKEN = os.environ.get("WA_CLOUD_TOKEN")
+WA_PHONE_ID = os.environ.get("WA_PHONE_ID")
+BACKEND = os.environ.get("WA_BACKEND", "cloud" if WA_CLOUD_TOKEN and WA_PHONE_ID else "selenium")
+CLOUD_API_URL = f"https://graph.facebook.com/v19.0/{WA_PHONE_ID}/messages"
+
+# Shared session for all outbound HTTP, keeps connections alive between messages.
+# Sends are retried when the connection failed or when rate limited or unavailable,
+# in which case the message was not accepted; not after read errors or on 502/504,
+# where it may have been sent already.
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, connect=3, read=False, backoff_factor=0.3, status_forcelist=[429, 503], allowed_methods=None),
+))
+atexit.register(_HTTP.close)
+
+
+def _normalize_phone(phone_number):
+    """Strips everything but the digits from a phone number, as WhatsApp expects"""
+    return _PHONE_RE.sub("", phone_number)
+
+
+def send_whatsapp_message(phone_number, message, group_id=None, on_done=None):
+    """Sends the message, returns the result.
+
+    When the message is handed to the pywhatkit fallback, the result is
+    "queued" and on_done (if given) is called with the final result.
+    """
+
+    full_message = _PREFIX + message
+    if phone_number:
+        phone_number = _normalize_phone(phone_number)
+
+    # The Cloud API cannot join groups by invite code, those go through the browser
+    if BACKEND == "cloud" and not group_id:
+        result = _send_cloud(phone_number, full_message)
+        # Unless the message was certainly not sent, the browser could send it twice
+        if not result.get("not_sent"):
+            return result
+
+        logger.info("Cloud API failed, trying browser method...")
 
     result = _send_with_browser(phone_number, full_message, group_id)
-    if result["status"] == "success":
+    if result["status"] == "success" or not result.get("not_sent", True):
         return result
     
 
     logger.info("Browser method failed, trying fallback method...")
-    return _open_whatsapp_directly(phone_number, full_message, group_id)
+    return _open_whatsapp_directly(phone_number, full_message, group_id, on_done)
 
 
-def _send_with_browser(phone_number, message, group_id=None):
+def queue_whatsapp_messages(phone_numbers, message):
+    """Queues the message for each phone number, returns the id of the batch.
 
-    global HAS_AUTHENTICATED
-    
+    Queued messages are sent in the background, see _drain_outbox.
+    """
+    batch_id = _new_job({"status": "queued", "pending": len(phone_numbers), "results": {}})
+
+    for phone_number in phone_numbers:
+        _OUTBOX.put((batch_id, phone_number, message))
+
+    _start_outbox()
+    return batch_id
+
+
+def _start_outbox():
+    global _outbox_thread
+
+    with _jobs_lock:
+        if _outbox_thread is None:
+            _outbox_thread = threading.Thread(target=_drain_outbox, name="whatsapp-outbox", daemon=True)
+            _outbox_thread.start()
+
+
+def _drain_outbox():
+    """Sends the queued messages, at most OUTBOX_BATCH_SIZE per second"""
+    while True:
+        batch = [_OUTBOX.get()]
+        while len(batch) < OUTBOX_BATCH_SIZE:
+            try:
+                batch.append(_OUTBOX.get_nowait())
+            except queue.Empty:
+                break
+
+        started = time.monotonic()
+        results = _SEND_EXECUTOR.map(
+            lambda item: _try_send(item[1], item[2], on_done=functools.partial(_record_result, item[0], item[1])),
+            batch,
+        )
+        for (batch_id, phone_number, _), result in zip(batch, results):
+            # Queued messages are recorded once the fallback is done
+            if result["status"] != "queued":
+                _record_result(batch_id, phone_number, result)
+
+        time.sleep(max(0, 1 - (time.monotonic() - started)))
+
+
+def _try_send(phone_number, message, group_id=None, on_done=None):
+    """send_whatsapp_message for background sends, failures are returned as an error"""
     try:
-        # Setup browser
-        chrome_options = Options()
-        
-        # Create profile directory if it doesn't exist
-        if not os.path.exists(PROFILE_DIR):
-            os.makedirs(PROFILE_DIR, exist_ok=True)
-        
-        # Use persistent profile to maintain login session
-        chrome_options.add_argument(f"--user-data-dir={PROFILE_DIR}")
-        
-        # Launch browser
-        driver = webdriver.Chrome(options=chrome_options)
-        
+        return send_whatsapp_message(phone_number, message, group_id, on_done)
+    except Exception as e:
+        logger.error(f"Error sending WhatsApp message: {e}")
+        return {"status": "error", "message": str(e)}
+
+
+def _record_result(batch_id, phone_number, result):
+    with _jobs_lock:
+        batch = _JOBS.get(batch_id)
+        if batch is None:
+            return
+
+        batch["results"][phone_number] = result["status"]
+        batch["pending"] -= 1
+        if batch["pending"] == 0:
+            batch["status"] = "done"
+
+
+def _new_job(job):
+    """Registers the status of a new job, returns its id"""
+    job_id = uuid.uuid4().hex
+    with _jobs_lock:
+        _JOBS[job_id] = job
+        while len(_JOBS) > MAX_JOBS:
+            _JOBS.popitem(last=False)
+
+    return job_id
+
+
+def _run_job(job_id, phone_number, message, group_id=None):
+    result = _try_send(phone_number, message, group_id, on_done=functools.partial(_update_job, job_id))
+    _update_job(job_id, result)
+
+
+def _update_job(job_id, result):
+    with _jobs_lock:
+        job = _JOBS.get(job_id)
+        if job is not None:
+            job.update(status=result["status"], result=result)
+
+
+def _retry(operation, retry_on, *args):
+    """Calls operation with args, retrying the exceptions in retry_on with backoff"""
+    for attempt in range(SEND_ATTEMPTS):
         try:
-            # Start at WhatsApp Web home
-            driver.get("https://web.whatsapp.com/")
-            
-            # Show QR code scan instructions if first time
-            if not HAS_AUTHENTICATED:
-                print("\n" + "="*60)
-                print("PLEASE SCAN QR CODE IN BROWSER WINDOW")
-                print("You only need to do this once")
-                print("="*60 + "\n")
-            
+            return operation(*args)
+        except retry_on as e:
+            if attempt == SEND_ATTEMPTS - 1:
+                raise
 
-            try:
-                WebDriverWait(driver, WAIT_TIME).until(
-                    EC.presence_of_element_located((By.XPATH, "//div[@contenteditable='true'][@data-tab='3']"))
-                )
-                HAS_AUTHENTICATED = True
-                logger.info("Authentication successful")
-            except TimeoutException:
-                logger.warning("Authentication timed out - waiting for QR code scan")
-                # Wait longer in case user is scanning QR code
-                WebDriverWait(driver, 60).until(
-                    EC.presence_of_element_located((By.XPATH, "//div[@contenteditable='true'][@data-tab='3']"))
-                )
-                HAS_AUTHENTICATED = True
-            
-            # Navigate to specific chat
-            if group_id:
-                driver.get(f"https://web.whatsapp.com/accept?code={group_id}")
-            else:
-                formatted_phone = phone_number.replace("+", "").replace(" ", "")
-                driver.get(f"https://web.whatsapp.com/send?phone={formatted_phone}")
-            
-            # Wait for chat to load
-            logger.info("Waiting for chat to load...")
-            time.sleep(5)
-            
-            # Check for and click join button if present
-            try:
-                join_buttons = driver.find_elements(By.XPATH, "//div[contains(text(), 'Join') or contains(text(), 'join')]")
-                if join_buttons:
-                    logger.info("Found join button, clicking...")
-                    join_buttons[0].click()
-                    time.sleep(3)
-            except Exception as e:
-                logger.info(f"No join button found or couldn't click: {e}")
-            
-            # Find text input box
-            input_box = WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.XPATH, "//div[@contenteditable='true'][@data-tab='10']"))
+            delay = min(RETRY_MAX_DELAY, RETRY_INITIAL_DELAY * 2 ** attempt) + random.uniform(0, RETRY_INITIAL_DELAY)
+            logger.warning(f"Attempt {attempt + 1} of {SEND_ATTEMPTS} failed, retrying in {delay:.1f}s: {e}")
+            time.sleep(delay)
+
+
+def _send_cloud(phone_number, message):
+    """Sends a text message to a phone number through the WhatsApp Cloud API.
+
+    Failed connections are retried by _HTTP, other failures are not, as the
+    message may have been sent already.
+    """
+    try:
+        response = _HTTP.post(
+            CLOUD_API_URL,
+            headers={"Authorization": f"Bearer {WA_CLOUD_TOKEN}"},
+            json={
+                "messaging_product": "whatsapp",
+                "to": phone_number,
+                "type": "text",
+                "text": {"body": message},
+            },
+            timeout=10,
+        )
+        response.raise_for_status()
+        result = response.json()
+
+        logger.info("Message sent successfully")
+        return {"status": "success", "message": "Message sent via Cloud API", "message_id": result["messages"][0]["id"]}
+
+    except Exception as e:
+        logger.error(f"Error using Cloud API: {e}")
+        return {"status": "error", "message": str(e), "not_sent": _cloud_not_sent(e)}
+
+
+def _cloud_not_sent(error):
+    """Whether the Cloud API certainly did not accept the message that failed with error"""
+    if isinstance(error, (requests.ConnectTimeout, requests.exceptions.RetryError)):
+        # Could not connect, or still rate limited or unavailable after the retries
+        return True
+
+    if isinstance(error, requests.HTTPError):
+        # Rejected, e.g. an invalid token or phone number
+        return 400 <= error.response.status_code < 500
+
+    if isinstance(error, requests.ConnectionError):
+        cause = error.args[0] if error.args else None
+        return isinstance(cause, MaxRetryError) and isinstance(cause.reason, NewConnectionError)
+
+    return False
+
+
+def _get_driver():
+    """Returns the browser logged in to WhatsApp Web, starting it on first use.
+
+    The browser is kept open between messages, must be called with _driver_lock held
+    so concurrent sends never start a second browser on the same profile.
+    """
+    global _driver
+
+    if _driver is not None:
+        return _driver
+
+    # A new profile has never been logged in
+    first_login = not os.listdir(PROFILE_DIR)
+
+    # Launch browser
+    driver = webdriver.Chrome(options=_CHROME_OPTIONS)
+
+    try:
+        # Start at WhatsApp Web home
+        driver.get("https://web.whatsapp.com/")
+
+        # Show QR code scan instructions if first time
+        if first_login:
+            print("\n" + "="*60)
+            print("PLEASE SCAN QR CODE IN BROWSER WINDOW")
+            print("You only need to do this once")
+            print("="*60 + "\n")
+
+
+        try:
+            WebDriverWait(driver, WAIT_TIME).until(
+                EC.presence_of_element_located(_LOC_SEARCH)
             )
-            
-            # Input message
-            input_box.clear()
-            
-            # Send in chunks to avoid issues
-            for chunk in [message[i:i+20] for i in range(0, len(message), 20)]:
-                input_box.send_keys(chunk)
-                time.sleep(0.2)
-            
-            # Send message
-            time.sleep(1)
-            input_box.send_keys(Keys.ENTER)
-            
-            # Take screenshot for debugging
+            logger.info("Authentication successful")
+        except TimeoutException:
+            logger.warning("Authentication timed out - waiting for QR code scan")
+            # Wait longer in case user is scanning QR code
+            WebDriverWait(driver, 60).until(
+                EC.presence_of_element_located(_LOC_SEARCH)
+            )
+    except Exception:
+        driver.quit()
+        raise
+
+    _driver = driver
+    return _driver
+
+
+def _quit_driver():
+    global _driver
+
+    if _driver is not None:
+        try:
+            _driver.quit()
+        except Exception as e:
+            logger.info(f"Could not quit browser: {e}")
+        _driver = None
+
+
+atexit.register(_quit_driver)
+
+
+def _find_first(driver, locators):
+    """Returns the first element found by any of the locators, or False if there is none (as WebDriverWait expects)"""
+    for by, selector in locators:
+        elements = driver.find_elements(by, selector)
+        if elements:
+            return elements[0]
+    return False
+
+
+def _send_with_browser(phone_number, message, group_id=None):
+
+    try:
+        # One browser tab is shared, so messages are sent one at a time
+        with _driver_lock:
             try:
-                screenshot_path = "whatsapp_debug.png"
-                driver.save_screenshot(screenshot_path)
-                logger.info(f"Saved screenshot to {screenshot_path}")
-            except Exception:
-                pass
-            
-            logger.info("Message sent successfully")
-            time.sleep(3)
-            return {"status": "success", "message": "Message sent successfully"}
-            
-        finally:
-            # Clean up
-            driver.quit()
+                return _retry(_send_once, WebDriverException, phone_number, message, group_id)
+            except WebDriverException:
+                # Give the next message a fresh browser
+                _quit_driver()
+                raise
     
     except Exception as e:
         logger.error(f"Error using browser method: {e}")
         return {"status": "error", "message": str(e)}
 
 
-def _open_whatsapp_directly(phone_number, message, group_id=None):
-    """Simple method to open WhatsApp Web and guide user to send message manually"""
+def _send_once(phone_number, message, group_id=None):
+    try:
+        return _send_on_driver(_get_driver(), phone_number, message, group_id)
+    except TimeoutException:
+        raise
+    except WebDriverException as e:
+        # The browser crashed or was closed, the next attempt starts a new one
+        logger.warning(f"Browser session lost, restarting browser: {e}")
+        _quit_driver()
+        raise
+
+
+def _last_outgoing(driver):
+    """Returns the last message sent in the open chat, None if there are none"""
+    messages = driver.find_elements(*_OUTGOING_LOCATOR)
+    return messages[-1] if messages else None
+
+
+def _send_on_driver(driver, phone_number, message, group_id=None):
+    """Sends a message in the chat with phone_number or group_id, raises on failure"""
+    # Navigate to specific chat
+    if group_id:
+        driver.get(f"https://web.whatsapp.com/accept?code={group_id}")
+    else:
+        driver.get(f"https://web.whatsapp.com/send?phone={phone_number}")
+    
+    # Wait for chat to load, or for the invitation to join the group
+    logger.info("Waiting for chat to load...")
+    WebDriverWait(driver, 20).until(lambda d: _find_first(d, _WA_SELECTORS + (_JOIN_LOCATOR,)))
+    
+    # Check for and click join button if present
+    try:
+        join_buttons = driver.find_elements(*_JOIN_LOCATOR)
+        if join_buttons:
+            logger.info("Found join button, clicking...")
+            join_buttons[0].click()
+    except Exception as e:
+        logger.info(f"No join button found or couldn't click: {e}")
+    
+    # Find text input box
+    input_box = WebDriverWait(driver, 20).until(lambda d: _find_first(d, _WA_SELECTORS))
+    
+    # Input message
+    input_box.clear()
+    input_box.click()
+    
+    # Insert the whole message with a single DevTools call, typing it
+    # would press Enter (and send) on every newline
+    driver.execute_cdp_cmd("Input.insertText", {"text": message})
+    
+    # The last message sent before, to recognize the new one
+    last_before = _last_outgoing(driver)
+
+    # Send message, once the editor has taken the text
+    WebDriverWait(driver, 5).until(lambda d: input_box.text.strip())
+    input_box.send_keys(Keys.ENTER)
+
+    # Wait for the message to show up in the chat. It may have been sent
+    # regardless, so it must not be sent again
+    try:
+        WebDriverWait(driver, 10).until(lambda d: _last_outgoing(d) not in (None, last_before))
+    except TimeoutException:
+        logger.error("Message did not show up in the chat")
+        return {"status": "error", "message": "Message did not show up in the chat", "not_sent": False}
+    
+    # Take screenshot for debugging
+    if DEBUG_SCREENSHOT:
+        try:
+            screenshot_path = f"whatsapp_debug_{uuid.uuid4().hex[:8]}.png"
+            driver.save_screenshot(screenshot_path)
+            logger.info(f"Saved screenshot to {screenshot_path}")
+        except Exception:
+            pass
+    
+    # Wait until the message has left the browser (its clock turns into a tick)
+    try:
+        WebDriverWait(driver, 10, ignored_exceptions=(StaleElementReferenceException,)).until(
+            lambda d: _last_outgoing(d).find_elements(*_SENT_LOCATOR)
+        )
+    except TimeoutException:
+        logger.warning("Message is still pending, it will be sent when WhatsApp Web reconnects")
+
+    logger.info("Message sent successfully")
+    return {"status": "success", "message": "Message sent successfully"}
+
+
+def _open_whatsapp_directly(phone_number, message, group_id=None, on_done=None):
+    """Simple method to open WhatsApp Web and guide user to send message manually.
+
+    pywhatkit blocks for over a minute while it waits for the scheduled time,
+    so it is run in a separate process, one message after the other, and the
+    message is reported as queued. on_done is called with the final result.
+    """
+    try:
+        executor = _fallback_executor()
+        try:
+            future = executor.submit(_pywhatkit_worker, phone_number, message, group_id)
+        except BrokenProcessPool:
+            # The worker process died, start a new one
+            executor = _fallback_executor(broken=executor)
+            future = executor.submit(_pywhatkit_worker, phone_number, message, group_id)
+
+        future.add_done_callback(functools.partial(_fallback_done, executor, on_done))
+        return {"status": "queued", "message": "Message handed to pywhatkit for sending"}
+
+    except Exception as e:
+        logger.error(f"Error opening WhatsApp Web: {e}")
+        return {"status": "error", "message": str(e)}
+
+
+def _fallback_executor(broken=None):
+    """Returns the process pool that runs the pywhatkit fallback, replacing the broken one.
+
+    Its process is spawned rather than forked, forking the threads of the
+    Flask server and the send executor is unsafe.
+    """
+    global _fallback_executor_instance
+
+    with _fallback_lock:
+        if broken is not None and broken is _fallback_executor_instance:
+            broken.shutdown(wait=False)
+            _fallback_executor_instance = None
+
+        if _fallback_executor_instance is None:
+            _fallback_executor_instance = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            )
+
+        return _fallback_executor_instance
+
+
+def _fallback_done(executor, on_done, future):
+    try:
+        result = future.result()
+    except BrokenProcessPool as e:
+        logger.error(f"pywhatkit process died: {e}")
+        _fallback_executor(broken=executor)
+        result = {"status": "error", "message": str(e)}
+    except Exception as e:
+        logger.error(f"Error opening WhatsApp Web: {e}")
+        result = {"status": "error", "message": str(e)}
+
+    if on_done is not None:
+        on_done(result)
+
+
+def _pywhatkit_worker(phone_number, message, group_id=None):
+    """Sends the message with pywhatkit, runs in a separate process"""
     try:
         # Configure pywhatkit
         try:
@@ -197,13 +611,13 @@ def _open_whatsapp_directly(phone_number, message, group_id=None):
                 return {"status": "partial", "message": "WhatsApp Web opened for manual sending"}
         else:
             # For individual messages
-            formatted_phone = phone_number.replace("+", "").replace(" ", "")
             try:
-                pywhatkit.sendwhatmsg(formatted_phone, message, hour, minute, wait_time=15)
+                # pywhatkit requires the country code to start with a +
+                pywhatkit.sendwhatmsg(f"+{phone_number}", message, hour, minute, wait_time=15)
                 return {"status": "success", "message": "Message sent via pywhatkit"}
             except Exception as e:
                 logger.warning(f"Pywhatkit message failed: {e}")
-                webbrowser.open(f"https://web.whatsapp.com/send?phone={formatted_phone}")
+                webbrowser.open(f"https://web.whatsapp.com/send?phone={phone_number}")
                 return {"status": "partial", "message": "WhatsApp Web opened for manual sending"}
     
     except Exception as e:
@@ -211,11 +625,11 @@ def _open_whatsapp_directly(phone_number, message, group_id=None):
         return {"status": "error", "message": str(e)}
 
 
-def send_flood_alert(hazard_index, group_id=None, phone_number=None, affected_regions=None, language='en'):
+def send_flood_alert(hazard_index, group_id=None, phone_number=None, affected_regions=None, language='en', phone_numbers=None):
 
-    if not group_id and not phone_number:
-        logger.error("Either group_id or phone_number must be provided")
-        return {"status": "error", "message": "Either group_id or phone_number must be provided"}
+    if not group_id and not phone_number and not phone_numbers:
+        logger.error("Either group_id, phone_number or phone_numbers must be provided")
+        return {"status": "error", "message": "Either group_id, phone_number or phone_numbers must be provided"}
     
     # Import translation function here to avoid circular imports
     from flood_threat import format_alert_message
@@ -224,6 +638,11 @@ def send_flood_alert(hazard_index, group_id=None, phone_number=None, affected_re
 
     logger.info(f"Sending flood alert with hazard index {hazard_index:.2f} for regions: {affected_regions or 'Unknown'} in {language}")
     
+    # Many recipients are queued and sent in batches
+    if phone_numbers:
+        batch_id = queue_whatsapp_messages(phone_numbers, message)
+        return {"status": "queued", "message": f"Alert queued for {len(phone_numbers)} recipients", "batch_id": batch_id}
+
     # Send the message
     return send_whatsapp_message(phone_number, message, group_id)
 
@@ -246,17 +665,29 @@ def send_alert():
     if not phone_number and not group_id:
         return jsonify({"status": "error", "message": "Either phone_number or group_id must be provided"}), 400
 
+    if phone_number and not isinstance(phone_number, str):
+        return jsonify({"status": "error", "message": "phone_number must be a string"}), 400
+
     hazard_index = data.get('hazard_index')
     if hazard_index:
         logger.info(f"Sending alert for hazard index: {hazard_index}")
     
-    # Send the message
-    result = send_whatsapp_message(phone_number, message, group_id)
+    # Send the message in the background, the client polls /status/<job_id>
+    job_id = _new_job({"status": "pending"})
+    _SEND_EXECUTOR.submit(_run_job, job_id, phone_number, message, group_id)
     
-    if result["status"] == "success":
-        return jsonify(result), 200
-    else:
-        return jsonify(result), 500
+    return jsonify({"status": "accepted", "job_id": job_id}), 202
+
+
+@app.route('/status/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """API endpoint to poll the status of an alert"""
+    with _jobs_lock:
+        job = _JOBS.get(job_id)
+        if job is None:
+            return jsonify({"status": "unknown"}), 404
+
+        return jsonify(job), 200
 
 
 if __name__ == "__main__":
@@ -265,5 +696,5 @@ if __name__ == "__main__":
     # Test direct message sending
     result = send_flood_alert(0.85, group_id="FAXzTqYTt4zF2h6OuVeUck")
     print(f"Result: {result}")
-    # Flask server:
-    # app.run(debug=True, port=5000)
\ No newline at end of file
+    # Flask server, sends run in the background so requests are handled on threads:
+    # app.run(debug=True, port=5000, threaded=True)
\ No newline at end of file